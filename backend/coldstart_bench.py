@@ -0,0 +1,83 @@
+"""Benchmark de cold start da API do Mentor de Concursos.
+
+Sobe o servidor do zero várias vezes e mede o tempo até o primeiro 200 em
+/health, aproximando o que o Cloud Run vê ao escalar uma nova instância.
+
+Uso:
+    python coldstart_bench.py --runs 5
+    python coldstart_bench.py --server flask
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import requests
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, port):
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+                '--workers', '1', '--threads', '8', 'main_enhanced:app']
+    return [sys.executable, '-c',
+            f"from main_enhanced import app; app.run(host='127.0.0.1', port={port})"]
+
+
+def measure_once(server, timeout):
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(server_command(server, port), cwd=BACKEND_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"Servidor encerrou com código {process.returncode}")
+            try:
+                if requests.get(f'http://127.0.0.1:{port}/health', timeout=1).status_code == 200:
+                    return time.perf_counter() - start
+            except requests.RequestException:
+                pass
+            time.sleep(0.01)
+        raise TimeoutError(f"/health não respondeu em {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def measure_import():
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main_enhanced'],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    # Linhas do -X importtime: "import time: self [us] | cumulative | nome"; outras
+    # mensagens no stderr (avisos, logs) são ignoradas
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == 'main_enhanced':
+            return int(fields[1]) / 1_000_000
+    raise RuntimeError("Tempo de importação de main_enhanced não encontrado na saída do -X importtime")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de cold start')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--server', choices=['gunicorn', 'flask'], default='gunicorn')
+    parser.add_argument('--timeout', type=float, default=60.0)
+    args = parser.parse_args()
+
+    print(f"import main_enhanced: {measure_import() * 1000:.1f} ms")
+    samples = [measure_once(args.server, args.timeout) for _ in range(args.runs)]
+    print(f"primeiro 200 em /health ({args.server}, {args.runs} execuções): "
+          f"mediana {statistics.median(samples) * 1000:.1f} ms, "
+          f"mín {min(samples) * 1000:.1f} ms, máx {max(samples) * 1000:.1f} ms")
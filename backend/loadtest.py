@@ -0,0 +1,85 @@
+"""Teste de carga simples para a API do Mentor de Concursos.
+
+Uso:
+    python loadtest.py --url http://localhost:8080 --requests 2000 --concurrency 16
+
+Rode contra o gunicorn com diferentes combinações de --workers/--threads
+para comparar vazão e latência de cauda antes de cada deploy.
+"""
+import argparse
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ROUTES = [
+    ('GET', '/health'),
+    ('HEAD', '/health'),
+    ('GET', '/api/test'),
+]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank: menor valor com pelo menos q das amostras abaixo ou iguais
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(base_url, total_requests, concurrency, timeout):
+    local = threading.local()
+    results = {route: [] for route in ROUTES}
+    client_errors = {route: 0 for route in ROUTES}
+    errors = {route: 0 for route in ROUTES}
+    lock = threading.Lock()
+
+    def session():
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        return local.session
+
+    def hit(i):
+        route = ROUTES[i % len(ROUTES)]
+        method, path = route
+        start = time.perf_counter()
+        try:
+            status = session().request(method, base_url + path, timeout=timeout).status_code
+        except requests.RequestException:
+            status = None
+        elapsed = time.perf_counter() - start
+        with lock:
+            results[route].append(elapsed)
+            if status is not None and 400 <= status < 500:
+                client_errors[route] += 1
+            elif status is None or status >= 500:
+                errors[route] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(hit, range(total_requests)))
+    wall = time.perf_counter() - start
+
+    print(f"{total_requests} requisições em {wall:.2f}s ({total_requests / wall:.1f} req/s), concorrência {concurrency}")
+    print(f"{'rota':<20} {'n':>6} {'4xx':>6} {'erros':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for (method, path), latencies in results.items():
+        latencies.sort()
+        print(
+            f"{method + ' ' + path:<20} {len(latencies):>6} {client_errors[(method, path)]:>6} "
+            f"{errors[(method, path)]:>6} "
+            f"{percentile(latencies, 0.50) * 1000:>8.1f} "
+            f"{percentile(latencies, 0.95) * 1000:>8.1f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.1f}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Teste de carga da API')
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+    run(args.url.rstrip('/'), args.requests, args.concurrency, args.timeout)
@@ -1,10 +1,163 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g, Response
 from flask_cors import CORS
+import bisect
+import cProfile
+import io
+import logging
 import os
+import pstats
+import random
+import threading
+import time
 
 app = Flask(__name__)
 CORS(app, origins=["http://localhost:3000", "http://localhost:3001"])
 
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger = logging.getLogger(__name__)
+
+# Limites (em segundos) dos buckets dos histogramas de latência
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Fração das requisições perfiladas com cProfile (0 desativa). A partir do Python 3.12
+# o cProfile usa sys.monitoring, que é global ao interpretador: só um perfil roda por vez
+# e a amostra inclui o trabalho das outras threads do processo.
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+_profile_lock = threading.Lock()
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def quantile(self, q):
+        # Estimativa por interpolação linear dentro do bucket, como o histogram_quantile do Prometheus
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if cumulative + count >= rank and count:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._status_counts = {}
+
+    def observe(self, route, method, status, duration):
+        with self._lock:
+            key = (route, method)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(duration)
+            status_key = (route, method, status)
+            self._status_counts[status_key] = self._status_counts.get(status_key, 0) + 1
+
+    def render_prometheus(self):
+        lines = [
+            '# HELP http_request_duration_seconds Latência das requisições HTTP por rota.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            status_counts = sorted(self._status_counts.items())
+            for (route, method), histogram in histograms:
+                labels = f'route="{route}",method="{method}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.total}')
+                lines.append(f'http_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{{labels}}} {histogram.total}')
+
+            lines.append('# HELP http_request_duration_quantile_seconds Quantis estimados de latência por rota.')
+            lines.append('# TYPE http_request_duration_quantile_seconds gauge')
+            for (route, method), histogram in histograms:
+                for q in QUANTILES:
+                    lines.append(
+                        f'http_request_duration_quantile_seconds{{route="{route}",method="{method}",quantile="{q}"}} '
+                        f'{histogram.quantile(q):.6f}'
+                    )
+
+            lines.append('# HELP http_requests_total Total de requisições HTTP por rota e status.')
+            lines.append('# TYPE http_requests_total counter')
+            for (route, method, status), count in status_counts:
+                lines.append(f'http_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = RequestMetrics()
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        # Pula a amostra se outra requisição já está sendo perfilada
+        if not _profile_lock.acquire(blocking=False):
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Outra ferramenta de profiling já está ativa no interpretador
+            _profile_lock.release()
+            return
+        g.profiler = profiler
+
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.pop('request_start', None)
+    if start is None:
+        return response
+    duration = time.perf_counter() - start
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe(route, request.method, response.status_code, duration)
+
+    profiler = stop_profiler()
+    if profiler is not None:
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(20)
+        logger.info("Perfil de %s %s (%.1f ms):\n%s", request.method, route, duration * 1000, stream.getvalue())
+
+    response.headers['Server-Timing'] = f'app;dur={duration * 1000:.1f}'
+    return response
+
+
+@app.teardown_request
+def release_profiler(exc):
+    # Garante que o perfil seja encerrado mesmo se o after_request não rodar
+    stop_profiler()
+
+
+def stop_profiler():
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        _profile_lock.release()
+    return profiler
+
+
 @app.route('/health', methods=['GET', 'HEAD'])
 def health_check():
     return jsonify({"status": "ok", "message": "Mentor de Concursos API funcionando"}), 200
@@ -13,6 +166,10 @@ def health_check():
 def test_api():
     return jsonify({"message": "API funcionando corretamente"}), 200
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=True)
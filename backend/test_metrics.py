@@ -0,0 +1,102 @@
+import pytest
+
+import main_enhanced
+from main_enhanced import LATENCY_BUCKETS, LatencyHistogram, RequestMetrics
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main_enhanced, 'metrics', RequestMetrics())
+    return main_enhanced.app.test_client()
+
+
+def test_bucket_upper_bound_is_inclusive():
+    histogram = LatencyHistogram()
+    histogram.observe(0.005)
+    histogram.observe(0.0051)
+    histogram.observe(0.01)
+    assert histogram.counts[0] == 1
+    assert histogram.counts[1] == 2
+    assert histogram.total == 3
+    assert histogram.sum == pytest.approx(0.0201)
+
+
+def test_values_above_last_bucket_go_to_overflow():
+    histogram = LatencyHistogram()
+    histogram.observe(30.0)
+    histogram.observe(45.0)
+    assert histogram.counts[len(LATENCY_BUCKETS) - 1] == 1
+    assert histogram.counts[len(LATENCY_BUCKETS)] == 1
+
+
+def test_quantile_of_empty_histogram_is_zero():
+    assert LatencyHistogram().quantile(0.99) == 0.0
+
+
+def test_quantile_interpolates_within_bucket():
+    histogram = LatencyHistogram()
+    for _ in range(100):
+        histogram.observe(0.2)  # bucket (0.1, 0.25]
+    assert histogram.quantile(0.5) == pytest.approx(0.175)
+    assert histogram.quantile(0.99) == pytest.approx(0.1 + 0.15 * 0.99)
+
+
+def test_quantile_across_buckets():
+    histogram = LatencyHistogram()
+    for _ in range(50):
+        histogram.observe(0.001)  # bucket [0, 0.005]
+    for _ in range(45):
+        histogram.observe(0.3)  # bucket (0.25, 0.5]
+    for _ in range(5):
+        histogram.observe(4.0)  # bucket (2.5, 5.0]
+    assert histogram.quantile(0.5) == pytest.approx(0.005)
+    assert histogram.quantile(0.95) == pytest.approx(0.5)
+    assert histogram.quantile(0.99) == pytest.approx(2.5 + 2.5 * 4 / 5)
+
+
+def test_quantile_in_overflow_bucket_returns_last_bound():
+    histogram = LatencyHistogram()
+    for _ in range(10):
+        histogram.observe(60.0)
+    assert histogram.quantile(0.5) == LATENCY_BUCKETS[-1]
+
+
+def test_render_prometheus_format():
+    metrics = RequestMetrics()
+    metrics.observe('/health', 'GET', 200, 0.003)
+    metrics.observe('/health', 'GET', 200, 0.02)
+    metrics.observe('/health', 'GET', 500, 40.0)
+    lines = metrics.render_prometheus().splitlines()
+
+    assert '# TYPE http_request_duration_seconds histogram' in lines
+    assert 'http_request_duration_seconds_bucket{route="/health",method="GET",le="0.005"} 1' in lines
+    assert 'http_request_duration_seconds_bucket{route="/health",method="GET",le="0.025"} 2' in lines
+    assert 'http_request_duration_seconds_bucket{route="/health",method="GET",le="30.0"} 2' in lines
+    assert 'http_request_duration_seconds_bucket{route="/health",method="GET",le="+Inf"} 3' in lines
+    assert 'http_request_duration_seconds_sum{route="/health",method="GET"} 40.023000' in lines
+    assert 'http_request_duration_seconds_count{route="/health",method="GET"} 3' in lines
+    assert 'http_requests_total{route="/health",method="GET",status="200"} 2' in lines
+    assert 'http_requests_total{route="/health",method="GET",status="500"} 1' in lines
+    assert any(line.startswith(
+        'http_request_duration_quantile_seconds{route="/health",method="GET",quantile="0.99"} '
+    ) for line in lines)
+
+
+def test_metrics_endpoint_reports_requests(client):
+    client.get('/health')
+    client.get('/health')
+    client.get('/api/test')
+    client.get('/rota-inexistente')
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    body = response.get_data(as_text=True)
+    assert 'http_request_duration_seconds_count{route="/health",method="GET"} 2' in body
+    assert 'http_request_duration_seconds_count{route="/api/test",method="GET"} 1' in body
+    assert 'http_requests_total{route="unmatched",method="GET",status="404"} 1' in body
+
+
+def test_responses_carry_server_timing(client):
+    response = client.get('/api/test')
+    assert response.headers['Server-Timing'].startswith('app;dur=')